@@ -5,13 +5,241 @@ A customizable resume formatting tool with section management and font controls.
 """
 
 import tkinter as tk
-from tkinter import ttk, scrolledtext, filedialog, messagebox
+from tkinter import ttk, scrolledtext
+import io
 import json
 import os
-import webbrowser
-import tempfile
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from html import escape
+from itertools import groupby
 import re
+import string
+
+# Section header patterns, matched against the start of each stripped line.
+# One alternation keeps header detection to a single regex call per line;
+# the group name that matched is the section name.
+_SECTION_HEADER = re.compile(
+    r'^(?:'
+    r'(?P<Contact>contact|personal|info)'
+    r'|(?P<Summary>summary|objective|profile)'
+    r'|(?P<Experience>experience|work|employment|career)'
+    r'|(?P<Education>education|academic|school)'
+    r'|(?P<Skills>skills|technical|competenc)'
+    r'|(?P<Projects>projects|portfolio)'
+    r'|(?P<Certifications>certification|certificate)'
+    r'|(?P<Awards>awards|achievement|honor)'
+    r')',
+    re.IGNORECASE
+)
+
+# Job entry headers: "Title | Company | 2020-2023" or "Title at Company (2020"
+_JOB_HEADER_PIPE = re.compile(r'^[A-Z].*\s+\|\s+.*\s+\|\s+\d{4}')
+_JOB_HEADER_AT = re.compile(r'^.*\s+at\s+.*\s+\(\d{4}', re.IGNORECASE)
+
+# Characters that mark a line as a bullet point
+_BULLET_CHARS = frozenset('•-')
+
+# Static head of the exported HTML page; only the fonts are filled in per export
+_HTML_HEAD = string.Template("""\
+<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <title>Resume</title>
+    <style>
+        body {
+            font-family: '${font_family}', Arial, sans-serif;
+            font-size: ${font_size}px;
+            line-height: 1.4;
+            max-width: 800px;
+            margin: 0 auto;
+            padding: 40px;
+            color: #2c3e50;
+        }
+        .header {
+            text-align: center;
+            margin-bottom: 30px;
+            border-bottom: 2px solid #3498db;
+            padding-bottom: 20px;
+        }
+        .section {
+            margin-bottom: 25px;
+        }
+        .section-title {
+            font-size: ${title_size}px;
+            font-weight: bold;
+            color: #2c3e50;
+            margin-bottom: 10px;
+            text-transform: uppercase;
+            border-bottom: 1px solid #bdc3c7;
+            padding-bottom: 5px;
+        }
+        .job-title {
+            font-weight: bold;
+            color: #34495e;
+            margin-top: 15px;
+        }
+        .contact-info {
+            text-align: center;
+            color: #7f8c8d;
+            margin-bottom: 20px;
+        }
+        ul {
+            margin: 10px 0;
+            padding-left: 20px;
+        }
+        li {
+            margin-bottom: 5px;
+        }
+        @media print {
+            body { padding: 20px; }
+        }
+    </style>
+</head>
+<body>
+""")
+
+_HTML_TAIL = """
+</body>
+</html>
+"""
+
+# Splits text into lines that keep their trailing newline
+_LINE_RE = re.compile(r'[^\n]*\n|[^\n]+')
+
+def _deep_merge(dst, src):
+    """Merge src into dst in place, recursing into nested dicts so defaults
+    missing from src are kept"""
+    for key, value in src.items():
+        if isinstance(value, dict) and isinstance(dst.get(key), dict):
+            _deep_merge(dst[key], value)
+        else:
+            dst[key] = value
+
+class _Renderer:
+    """Parses resume text and writes it as HTML without any Tk state
+    
+    Used by the GUI's Generate/Export buttons and by batch export. The HTML
+    of each section is cached by its content, so resumes that share
+    sections, or repeated exports of the same one, skip re-rendering them.
+    """
+    def __init__(self):
+        self._section_cache = {}
+    
+    @staticmethod
+    def parse_resume_text(text):
+        """Parse the input text into structured resume data"""
+        sections = {}
+        current_section = None
+        lines = text.splitlines()
+        
+        for raw_line in lines:
+            # Strip once; the header regex is case-insensitive, so no lower() copy
+            line = raw_line.strip()
+            if not line:
+                continue
+                
+            # Check if line is a section header
+            match = _SECTION_HEADER.match(line)
+            found_section = match.lastgroup if match else None
+            
+            if found_section:
+                current_section = found_section
+                sections[current_section] = []
+            elif current_section:
+                sections[current_section].append(line)
+            else:
+                # If no section found yet, assume it's contact info
+                sections.setdefault('Contact', []).append(line)
+        
+        return sections
+    
+    def write_html(self, content_sections, out, font_family, font_size, sections):
+        """Write the HTML version of the resume to the text stream out"""
+        out.write(_HTML_HEAD.substitute(font_family=font_family, font_size=font_size,
+                                        title_size=font_size + 3))
+        
+        for section in sections:
+            if section in content_sections and content_sections[section]:
+                out.write(self.section_html(section, content_sections[section]))
+        
+        out.write(_HTML_TAIL)
+    
+    def section_html(self, section, content):
+        """Return the HTML for one section, reusing it if the content is unchanged"""
+        key = (section, tuple(content))
+        cached = self._section_cache.get(key)
+        if cached is not None:
+            return cached
+        
+        parts = ['<div class="section">']
+        
+        if section == 'Contact':
+            parts.append('<div class="contact-info">')
+            parts.append('<br>'.join(escape(line, quote=False) for line in content))
+            parts.append('</div>')
+        else:
+            parts.append(f'<div class="section-title">{section}</div>')
+            
+            if section == 'Experience':
+                parts.append(self.format_experience_html(content))
+            elif section == 'Skills':
+                parts.append('<ul>')
+                parts.append(''.join(f'<li>{escape(skill, quote=False)}</li>' for skill in content))
+                parts.append('</ul>')
+            else:
+                # Consecutive bullet lines form one list; other lines are paragraphs
+                parts.append('<div>')
+                for is_bullet, run in groupby(content, key=lambda item: item[:1] in _BULLET_CHARS):
+                    if is_bullet:
+                        parts.append('<ul>')
+                        parts.append(''.join(f'<li>{escape(item[1:].strip(), quote=False)}</li>' for item in run))
+                        parts.append('</ul>')
+                    else:
+                        parts.append(''.join(f'<p>{escape(item, quote=False)}</p>' for item in run))
+                parts.append('</div>')
+        
+        parts.append('</div>')
+        
+        html = ''.join(parts)
+        if len(self._section_cache) >= 256:
+            self._section_cache.clear()
+        self._section_cache[key] = html
+        return html
+    
+    def format_experience_html(self, experience_content):
+        """Format experience section for HTML"""
+        parts = []
+        current_job = []
+        
+        for line in experience_content:
+            if _JOB_HEADER_PIPE.match(line) or _JOB_HEADER_AT.match(line):
+                if current_job:
+                    parts.append(self.format_job_html(current_job))
+                    current_job = []
+                current_job.append(line)
+            else:
+                current_job.append(line)
+        
+        if current_job:
+            parts.append(self.format_job_html(current_job))
+        
+        return ''.join(parts)
+    
+    def format_job_html(self, job_lines):
+        """Format a single job entry for HTML"""
+        if not job_lines:
+            return ""
+        
+        parts = [f'<div class="job-title">{escape(job_lines[0], quote=False)}</div>']
+        
+        if len(job_lines) > 1:
+            parts.append('<ul>')
+            parts.append(''.join(f'<li>{escape(detail.lstrip("•-").strip(), quote=False)}</li>'
+                                 for detail in job_lines[1:] if detail.strip()))
+            parts.append('</ul>')
+        
+        return ''.join(parts)
 
 class ResumeFormatter:
     def __init__(self, root):
@@ -31,8 +259,28 @@ class ResumeFormatter:
             'colors': {'primary': '#2c3e50', 'secondary': '#34495e', 'text': '#2c3e50'}
         }
         
+        # Pending debounced preview callback, and whether a formatting setting
+        # changed since the last preview (text edits are tracked by Tk's
+        # edit_modified flag on the input widget)
+        self._preview_after_id = None
+        self._settings_dirty = True
+        
+        # Render caches: last parsed input, formatted sections keyed by their
+        # content, and the text currently shown in the preview pane
+        self._parse_cache = (None, None)
+        self._section_cache = {}
+        self._last_preview = None
+        
+        # Previews are built on a single worker thread so parsing large
+        # resumes does not block typing. Each request gets a new token and
+        # results for older tokens are dropped.
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._preview_token = 0
+        self._html_renderer = _Renderer()
+        
         self.load_settings()
         self.create_widgets()
+        self.text_input.edit_modified(False)
         
     def create_widgets(self):
         # Create main paned window
@@ -73,12 +321,12 @@ class ResumeFormatter:
                                  values=['Arial', 'Calibri', 'Times New Roman', 'Georgia', 'Verdana'],
                                  state='readonly', width=15)
         font_combo.grid(row=0, column=1, padx=5)
-        font_combo.bind('<<ComboboxSelected>>', self.update_preview)
+        font_combo.bind('<<ComboboxSelected>>', self._on_setting_change)
         
         ttk.Label(font_frame, text="Font Size:").grid(row=0, column=2, sticky=tk.W, padx=(10, 5))
         self.font_size_var = tk.StringVar(value=str(self.settings['fonts']['body']['size']))
         font_size_spin = ttk.Spinbox(font_frame, from_=8, to=16, textvariable=self.font_size_var, 
-                                    width=5, command=self.update_preview)
+                                    width=5, command=self._on_setting_change)
         font_size_spin.grid(row=0, column=3, padx=5)
         
         # Section management
@@ -95,8 +343,9 @@ class ResumeFormatter:
         for i, section in enumerate(available_sections):
             var = tk.BooleanVar(value=section in self.settings['sections'])
             self.section_vars[section] = var
-            cb = ttk.Checkbutton(section_checkboxes, text=section, variable=var, command=self.update_preview)
+            cb = ttk.Checkbutton(section_checkboxes, text=section, variable=var, command=self._on_section_toggle)
             cb.grid(row=i//4, column=i%4, sticky=tk.W, padx=5, pady=2)
+        self._update_active_sections()
         
         # Action buttons
         button_frame = ttk.Frame(parent)
@@ -120,88 +369,71 @@ class ResumeFormatter:
         self.preview_text.tag_configure('body', font=('Arial', 11, 'normal'))
         self.preview_text.tag_configure('contact', font=('Arial', 10, 'normal'), foreground='#7f8c8d')
         
+    def _update_active_sections(self):
+        """Record which sections are checked, in display order"""
+        self._active_sections = tuple(section for section, var in self.section_vars.items() if var.get())
+        
+    def _on_section_toggle(self):
+        """Refresh the active sections and the preview after a checkbox change"""
+        self._update_active_sections()
+        self._on_setting_change()
+        
+    def _on_setting_change(self, event=None):
+        """Refresh the preview after a font or section setting changed"""
+        self._settings_dirty = True
+        self.update_preview()
+        
     def on_text_change(self, event=None):
         """Update preview when text changes"""
-        self.root.after(500, self.update_preview)  # Delay to avoid too frequent updates
+        # Restart the delay on every keystroke so a burst of typing renders once
+        if self._preview_after_id:
+            self.root.after_cancel(self._preview_after_id)
+        self._preview_after_id = self.root.after(300, self._run_preview)
+        
+    def _run_preview(self):
+        """Run the debounced preview update"""
+        self._preview_after_id = None
+        self.update_preview()
         
     def parse_resume_text(self, text):
         """Parse the input text into structured resume data"""
-        sections = {}
-        current_section = None
-        lines = text.strip().split('\n')
-        
-        # Common section headers
-        section_patterns = {
-            'Contact': r'^(contact|personal|info)',
-            'Summary': r'^(summary|objective|profile)',
-            'Experience': r'^(experience|work|employment|career)',
-            'Education': r'^(education|academic|school)',
-            'Skills': r'^(skills|technical|competenc)',
-            'Projects': r'^(projects|portfolio)',
-            'Certifications': r'^(certification|certificate)',
-            'Awards': r'^(awards|achievement|honor)'
-        }
-        
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-                
-            # Check if line is a section header
-            found_section = None
-            for section, pattern in section_patterns.items():
-                if re.match(pattern, line.lower()):
-                    found_section = section
-                    break
-            
-            if found_section:
-                current_section = found_section
-                sections[current_section] = []
-            elif current_section:
-                sections[current_section].append(line)
-            else:
-                # If no section found yet, assume it's contact info
-                if 'Contact' not in sections:
-                    sections['Contact'] = []
-                sections['Contact'].append(line)
-        
-        return sections
+        return _Renderer.parse_resume_text(text)
     
     def format_section(self, section_name, content):
         """Format a section based on its type"""
         if not content:
             return ""
             
-        formatted = f"\n{section_name.upper()}\n" + "="*len(section_name) + "\n\n"
+        parts = [f"\n{section_name.upper()}\n", "="*len(section_name), "\n\n"]
         
         if section_name == 'Contact':
-            formatted += '\n'.join(content) + "\n"
+            parts.append('\n'.join(content) + "\n")
         elif section_name == 'Experience':
             # Try to format experience entries
             current_job = []
             for line in content:
-                if re.match(r'^[A-Z].*\s+\|\s+.*\s+\|\s+\d{4}', line) or \
-                   re.match(r'^.*\s+at\s+.*\s+\(\d{4}', line.lower()):
+                if _JOB_HEADER_PIPE.match(line) or _JOB_HEADER_AT.match(line):
                     if current_job:
-                        formatted += self.format_job_entry(current_job) + "\n"
+                        parts.append(self.format_job_entry(current_job) + "\n")
                         current_job = []
                     current_job.append(line)
                 else:
                     current_job.append(line)
             if current_job:
-                formatted += self.format_job_entry(current_job)
+                parts.append(self.format_job_entry(current_job))
         elif section_name == 'Skills':
             # Format skills as categories or lists
-            formatted += '\n'.join(f"• {skill}" for skill in content)
+            parts.append('\n'.join(f"• {skill}" for skill in content))
         else:
             # Default formatting
             for line in content:
-                if line.startswith('•') or line.startswith('-'):
-                    formatted += f"  {line}\n"
+                if line[:1] in _BULLET_CHARS:
+                    parts.append(f"  {line}\n")
                 else:
-                    formatted += f"{line}\n"
+                    parts.append(f"{line}\n")
         
-        return formatted + "\n"
+        parts.append("\n")
+        return ''.join(parts)
     
     def format_job_entry(self, job_lines):
         """Format a job entry"""
@@ -212,195 +444,143 @@ class ResumeFormatter:
         header = job_lines[0]
         details = job_lines[1:] if len(job_lines) > 1 else []
         
-        formatted = f"{header}\n"
+        parts = [f"{header}\n"]
         for detail in details:
             if detail.strip():
-                if not detail.startswith('•') and not detail.startswith('-'):
-                    formatted += f"• {detail}\n"
+                if detail[:1] not in _BULLET_CHARS:
+                    parts.append(f"• {detail}\n")
                 else:
-                    formatted += f"  {detail}\n"
+                    parts.append(f"  {detail}\n")
         
-        return formatted
+        return ''.join(parts)
     
     def update_preview(self, event=None):
         """Update the preview pane"""
-        text = self.text_input.get('1.0', tk.END).strip()
-        if not text:
-            self.preview_text.config(state=tk.NORMAL)
-            self.preview_text.delete('1.0', tk.END)
-            self.preview_text.insert('1.0', "Enter your resume content to see the preview...")
-            self.preview_text.config(state=tk.DISABLED)
+        # Nothing to do if neither the text nor a setting changed, e.g. for
+        # arrow keys; this avoids copying the whole buffer out of Tk
+        if not self.text_input.edit_modified() and not self._settings_dirty:
             return
+        self.text_input.edit_modified(False)
+        self._settings_dirty = False
+        
+        # Read the text here; the worker thread must not touch widgets
+        text = self.text_input.get('1.0', 'end-1c')
+        self._preview_token += 1
+        future = self._executor.submit(self._build_preview, text, self._active_sections)
+        self._poll_preview(future, self._preview_token)
+    
+    def _poll_preview(self, future, token):
+        """Show a finished preview on the Tk thread unless a newer one was requested"""
+        if token != self._preview_token:
+            return
+        if not future.done():
+            self.root.after(10, self._poll_preview, future, token)
+            return
+        self._set_preview(future.result())
+    
+    def _build_preview(self, text, active_sections):
+        """Build the preview text for the given input (runs on the worker thread)"""
+        if not text or text.isspace():
+            return "Enter your resume content to see the preview..."
+        
+        # Parse the text, reusing the last result if the input is unchanged
+        cached_text, parsed_sections = self._parse_cache
+        if text != cached_text:
+            parsed_sections = self.parse_resume_text(text)
+            self._parse_cache = (text, parsed_sections)
         
-        # Parse the text
-        parsed_sections = self.parse_resume_text(text)
-        
-        # Generate formatted preview
-        preview_content = ""
-        active_sections = [section for section, var in self.section_vars.items() if var.get()]
+        # Generate formatted preview, only re-formatting sections whose
+        # content changed since the last update
+        parts = []
+        section_cache = {}
         
         for section in active_sections:
             if section in parsed_sections:
-                preview_content += self.format_section(section, parsed_sections[section])
-        
-        # Update preview
-        self.preview_text.config(state=tk.NORMAL)
-        self.preview_text.delete('1.0', tk.END)
-        self.preview_text.insert('1.0', preview_content)
-        self.preview_text.config(state=tk.DISABLED)
+                key = (section, tuple(parsed_sections[section]))
+                formatted = self._section_cache.get(key)
+                if formatted is None:
+                    formatted = self.format_section(section, parsed_sections[section])
+                section_cache[key] = formatted
+                parts.append(formatted)
+        
+        self._section_cache = section_cache
+        return ''.join(parts)
     
-    def generate_html(self, content_sections):
-        """Generate HTML version of the resume"""
-        font_family = self.font_var.get()
-        font_size = self.font_size_var.get()
-        
-        html = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="UTF-8">
-            <title>Resume</title>
-            <style>
-                body {{
-                    font-family: '{font_family}', Arial, sans-serif;
-                    font-size: {font_size}px;
-                    line-height: 1.4;
-                    max-width: 800px;
-                    margin: 0 auto;
-                    padding: 40px;
-                    color: #2c3e50;
-                }}
-                .header {{
-                    text-align: center;
-                    margin-bottom: 30px;
-                    border-bottom: 2px solid #3498db;
-                    padding-bottom: 20px;
-                }}
-                .section {{
-                    margin-bottom: 25px;
-                }}
-                .section-title {{
-                    font-size: {int(font_size) + 3}px;
-                    font-weight: bold;
-                    color: #2c3e50;
-                    margin-bottom: 10px;
-                    text-transform: uppercase;
-                    border-bottom: 1px solid #bdc3c7;
-                    padding-bottom: 5px;
-                }}
-                .job-title {{
-                    font-weight: bold;
-                    color: #34495e;
-                    margin-top: 15px;
-                }}
-                .contact-info {{
-                    text-align: center;
-                    color: #7f8c8d;
-                    margin-bottom: 20px;
-                }}
-                ul {{
-                    margin: 10px 0;
-                    padding-left: 20px;
-                }}
-                li {{
-                    margin-bottom: 5px;
-                }}
-                @media print {{
-                    body {{ padding: 20px; }}
-                }}
-            </style>
-        </head>
-        <body>
-        """
-        
-        active_sections = [section for section, var in self.section_vars.items() if var.get()]
+    def _set_preview(self, content):
+        """Show content in the preview pane, replacing only the lines that changed"""
+        if content == self._last_preview:
+            return
         
-        for section in active_sections:
-            if section in content_sections and content_sections[section]:
-                html += f'<div class="section">'
-                
-                if section == 'Contact':
-                    html += '<div class="contact-info">'
-                    html += '<br>'.join(content_sections[section])
-                    html += '</div>'
-                else:
-                    html += f'<div class="section-title">{section}</div>'
-                    
-                    if section == 'Experience':
-                        html += self.format_experience_html(content_sections[section])
-                    elif section == 'Skills':
-                        html += '<ul>'
-                        for skill in content_sections[section]:
-                            html += f'<li>{skill}</li>'
-                        html += '</ul>'
-                    else:
-                        html += '<div>'
-                        for item in content_sections[section]:
-                            if item.startswith('•') or item.startswith('-'):
-                                html += f'<li>{item[1:].strip()}</li>'
-                            else:
-                                html += f'<p>{item}</p>'
-                        html += '</div>'
-                
-                html += '</div>'
+        old_lines = _LINE_RE.findall(self._last_preview or "")
+        new_lines = _LINE_RE.findall(content)
         
-        html += """
-        </body>
-        </html>
-        """
+        # Skip the lines shared at the start and end of the old and new text
+        limit = min(len(old_lines), len(new_lines))
+        start = 0
+        while start < limit and old_lines[start] == new_lines[start]:
+            start += 1
+        limit -= start
+        end = 0
+        while end < limit and old_lines[-1 - end] == new_lines[-1 - end]:
+            end += 1
         
-        return html
+        self.preview_text.config(state=tk.NORMAL)
+        self.preview_text.delete(f'{start + 1}.0', f'{len(old_lines) - end + 1}.0')
+        self.preview_text.insert(f'{start + 1}.0', ''.join(new_lines[start:len(new_lines) - end]))
+        self.preview_text.config(state=tk.DISABLED)
+        self._last_preview = content
     
-    def format_experience_html(self, experience_content):
-        """Format experience section for HTML"""
-        html = ""
-        current_job = []
-        
-        for line in experience_content:
-            if re.match(r'^[A-Z].*\s+\|\s+.*\s+\|\s+\d{4}', line) or \
-               re.match(r'^.*\s+at\s+.*\s+\(\d{4}', line.lower()):
-                if current_job:
-                    html += self.format_job_html(current_job)
-                    current_job = []
-                current_job.append(line)
-            else:
-                current_job.append(line)
-        
-        if current_job:
-            html += self.format_job_html(current_job)
-        
-        return html
+    def generate_html(self, content_sections, out):
+        """Write the HTML version of the resume to the text stream out"""
+        # The spinbox holds a string; convert it once so the CSS gets clean integers
+        self._html_renderer.write_html(content_sections, out, self.font_var.get(),
+                                       int(self.font_size_var.get()), self._active_sections)
     
-    def format_job_html(self, job_lines):
-        """Format a single job entry for HTML"""
-        if not job_lines:
-            return ""
-        
-        html = f'<div class="job-title">{job_lines[0]}</div>'
+    @staticmethod
+    def export_batch(items, out_dir, settings):
+        """Write one HTML file per (name, text) pair in items to out_dir
         
-        if len(job_lines) > 1:
-            html += '<ul>'
-            for detail in job_lines[1:]:
-                if detail.strip():
-                    clean_detail = detail.lstrip('•-').strip()
-                    html += f'<li>{clean_detail}</li>'
-            html += '</ul>'
-        
-        return html
+        Uses the font and section choices from a settings dict shaped like
+        ResumeFormatter.settings and needs no Tk window. Returns the paths
+        of the written files.
+        """
+        renderer = _Renderer()
+        font_family = settings['fonts']['body']['family']
+        font_size = int(settings['fonts']['body']['size'])
+        sections = tuple(settings['sections'])
+        
+        paths = []
+        for name, text in items:
+            path = os.path.join(out_dir, f"{name}.html")
+            buf = io.StringIO()
+            renderer.write_html(renderer.parse_resume_text(text), buf, font_family, font_size, sections)
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(buf.getvalue())
+            paths.append(path)
+        return paths
     
     def generate_resume(self):
         """Generate and preview the formatted resume"""
-        text = self.text_input.get('1.0', tk.END).strip()
-        if not text:
+        # Only needed by the buttons, so imported on first use to keep startup light
+        from tkinter import messagebox
+        import tempfile
+        import webbrowser
+        
+        text = self.text_input.get('1.0', 'end-1c')
+        if not text or text.isspace():
             messagebox.showwarning("Warning", "Please enter resume content first.")
             return
         
         parsed_sections = self.parse_resume_text(text)
-        html_content = self.generate_html(parsed_sections)
         
-        # Create temporary HTML file and open in browser
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.html', delete=False) as f:
-            f.write(html_content)
+        # Build the page in memory, encode it once and write the bytes to a
+        # temporary file that is opened in the browser
+        buf = io.StringIO()
+        self.generate_html(parsed_sections, buf)
+        data = buf.getvalue().encode('utf-8')
+        
+        with tempfile.NamedTemporaryFile(mode='wb', suffix='.html', delete=False) as f:
+            f.write(data)
             temp_file = f.name
         
         webbrowser.open(f'file://{temp_file}')
@@ -408,8 +588,10 @@ class ResumeFormatter:
     
     def export_html(self):
         """Export the resume as HTML file"""
-        text = self.text_input.get('1.0', tk.END).strip()
-        if not text:
+        from tkinter import filedialog, messagebox
+        
+        text = self.text_input.get('1.0', 'end-1c')
+        if not text or text.isspace():
             messagebox.showwarning("Warning", "Please enter resume content first.")
             return
         
@@ -420,18 +602,24 @@ class ResumeFormatter:
         
         if filename:
             parsed_sections = self.parse_resume_text(text)
-            html_content = self.generate_html(parsed_sections)
+            
+            # Render fully before opening the target so a failure (e.g. a
+            # non-numeric font size) cannot truncate an existing file
+            buf = io.StringIO()
+            self.generate_html(parsed_sections, buf)
             
             with open(filename, 'w', encoding='utf-8') as f:
-                f.write(html_content)
+                f.write(buf.getvalue())
             
             messagebox.showinfo("Success", f"Resume exported to {filename}")
     
     def save_settings(self):
         """Save current settings to file"""
+        from tkinter import messagebox
+        
         self.settings['fonts']['body']['family'] = self.font_var.get()
         self.settings['fonts']['body']['size'] = int(self.font_size_var.get())
-        self.settings['sections'] = [section for section, var in self.section_vars.items() if var.get()]
+        self.settings['sections'] = list(self._active_sections)
         
         settings_file = os.path.join(os.path.expanduser('~'), '.resume_formatter_settings.json')
         try:
@@ -448,7 +636,7 @@ class ResumeFormatter:
             if os.path.exists(settings_file):
                 with open(settings_file, 'r') as f:
                     saved_settings = json.load(f)
-                self.settings.update(saved_settings)
+                _deep_merge(self.settings, saved_settings)
         except Exception as e:
             print(f"Could not load settings: {e}")
 